@@ -1,19 +1,13 @@
 
 import os
+import re
+from pathlib import Path
 
 filepath = "/Applications/Bharat Properties/mobile-app/app/add-inventory.tsx"
-with open(filepath, "r") as f:
-    lines = f.readlines()
-
 start_marker = "// ─── Builtup Detail/Type Fetching effects ───────────────────────────────────"
 end_marker = "    useEffect(() => {\n"
 replacement_end_marker = "    useEffect(() => {\n        const fetchSystemData = async () => {"
 
-# We want to replace the useEffect block following the start_marker until the next useEffect
-new_lines = []
-skip = False
-found_marker = False
-
 new_code = """    useEffect(() => {
         const fetchBuiltupDetail = async () => {
             if (!form.subCategory) { setBuiltupDetailLookups([]); return; }
@@ -42,24 +36,36 @@ new_code = """    useEffect(() => {
     }, [form.builtupDetail, builtupDetailLookups]);
 
 """
+# Encoded once at import so repeated patch() calls reuse the same bytes
+NEW_CODE_BYTES = new_code.encode("utf-8")
+
+# Marker line (group 1), then everything up to the useEffect whose body opens with fetchSystemData
+BUILTUP_BLOCK_RE = re.compile(
+    rb"(^[ \t]*" + re.escape(start_marker.encode("utf-8")) + rb"[^\n]*\n)"
+    rb".*?(?=^[^\n]*useEffect\(\(\) => \{[^\n]*\n[^\n]*fetchSystemData)",
+    re.DOTALL | re.MULTILINE,
+)
+
+
+def patch_builtup(data):
+    # We want to replace the useEffect block following the start_marker until the next useEffect
+    out, found = BUILTUP_BLOCK_RE.subn(lambda m: m.group(1) + NEW_CODE_BYTES, data, count=1)
+    if not found:
+        raise ValueError("Could not find the start marker.")
+    return out
+
+
+def patch(filepath):
+    try:
+        out = patch_builtup(Path(filepath).read_bytes())
+    except ValueError:
+        return False
+    Path(filepath).write_bytes(out)
+    return True
 
-for line in lines:
-    if start_marker in line:
-        new_lines.append(line)
-        new_lines.append(new_code)
-        skip = True
-        found_marker = True
-        continue
-    
-    if skip and "useEffect(() => {" in line and "fetchSystemData" in lines[lines.index(line)+1]:
-        skip = False
-    
-    if not skip:
-        new_lines.append(line)
 
-if found_marker:
-    with open(filepath, "w") as f:
-        f.writelines(new_lines)
-    print("Successfully updated the file.")
-else:
-    print("Could not find the start marker.")
+if __name__ == "__main__":
+    if patch(filepath):
+        print("Successfully updated the file.")
+    else:
+        print("Could not find the start marker.")
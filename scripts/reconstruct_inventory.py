@@ -1,5 +1,6 @@
 
 import os
+from pathlib import Path
 
 filepath = "/Applications/Bharat Properties/mobile-app/app/add-inventory.tsx"
 
@@ -516,5 +517,15 @@ with open(filepath, "w") as f:
 print("Successfully reconstructed the file.")
 """
 
-with open(filepath, "w") as f:
-    f.write(code)
+CODE_BYTES = code.encode("utf-8")
+
+
+def reconstruct(data=b""):
+    # The template replaces the file wholesale, so the current contents are ignored
+    return CODE_BYTES
+
+
+if __name__ == "__main__":
+    # One write() call for the whole payload instead of several 8 KiB buffer flushes
+    Path(filepath).write_bytes(reconstruct())
+    print("Successfully reconstructed the file.")
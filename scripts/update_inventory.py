@@ -0,0 +1,24 @@
+
+import argparse
+from pathlib import Path
+
+from fix_builtup import filepath, patch_builtup
+from reconstruct_inventory import reconstruct
+
+# Runs the reconstruct and builtup-fix transforms on one in-memory buffer,
+# so add-inventory.tsx is read and written at most once per run.
+
+parser = argparse.ArgumentParser(description="Rewrite add-inventory.tsx in a single pass.")
+parser.add_argument("--reconstruct", action="store_true", help="start from the full reconstructed template")
+parser.add_argument("path", nargs="?", default=filepath)
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    data = reconstruct() if args.reconstruct else Path(args.path).read_bytes()
+    try:
+        data = patch_builtup(data)
+    except ValueError as e:
+        print(e)
+    else:
+        Path(args.path).write_bytes(data)
+        print("Successfully updated the file.")